@@ -19,6 +19,12 @@ class Node:
 
     min_conf : The minimum confidence level needed for rule to be considered.
 
+    pass_count : The number of full passes over the dataset needed by the last mining run.
+
+    to_transition : Nodes boxed while counting the current block, whose supersets are yet to be transitioned to DC.
+
+    to_finalize : Nodes which completed a full scan while counting the current block, yet to be closed off as solid.
+
     """
 
     total_records = None
@@ -26,10 +32,11 @@ class Node:
     min_sup = None
     min_conf = None
     rule_count = 0
+    pass_count = 0
     rules = dict()
 
-    to_transition = set()
-    to_finalize = set()
+    to_transition = []
+    to_finalize = []
 
     def __init__(self, root=None, items=(), tid=-1):
         self.root: Node = root
@@ -42,7 +49,6 @@ class Node:
         self.pending = False
         self.indices = []
         self.is_finalized = False
-        self.has_transitioned = False
 
     @staticmethod
     def calculate_support(curr_support):
@@ -136,6 +142,27 @@ class Node:
         """
         self.children[key] = Node(self, self.items + key, tid)
 
+    def add_itemset(self, S):
+        """
+        Add the path of nodes representing itemset S below the current node, creating nodes as needed.
+
+        Parameters
+        ----------
+        S: sorted tuple of items to sequentially add below the current node.
+
+        Returns
+        -------
+        Node which represents itemset S.
+
+        """
+        node = self
+        for Si in S:
+            Si = (Si,)
+            if not node.children.get(Si, False):
+                node.add_child(Si)
+            node = node.children[Si]
+        return node
+
     def find_node(self, S):
         """
         Prefix search using elements of S.
@@ -174,29 +201,30 @@ class Node:
 
     def handle_supersets(self):
         """
-        Check to see if any children of the Node are suspected of being small.
-        To do this, iterate over each of the Node's children. For each child, consider all possible combinations
-        of the child's itemsets and attempt to traverse to those nodes. If the child's subset Nodes are all Boxes, then
-        the child is suspected of being small and is transitioned to DC,
+        Transition the unmarked children of a newly boxed Node to DC.
+        DIC only promotes a superset once all of its immediate subsets are boxed. This intentionally skips that
+        subset check and keeps the previous effective behavior, whose check never ran as trie keys hold one item.
 
         """
-        for child in self.children:
-            transition_child = True
+        for child in self.children.values():
+            if child.state == State.UNMARKED:
+                child.state = State.DASHED_CIRCLE
 
-            # Generate all sized combinations of the child itemset from 1 to the max length of the child itemset.
-            for i in range(1, len(child)):
-                if not transition_child:
-                    break
-                paths = combinations(self.children[child].item, r=i)
+    @staticmethod
+    def apply_transitions():
+        """
+        Apply the state transitions recorded while counting a block in a single batched pass.
+        Supersets of the itemsets boxed during the block are transitioned to DC, then every itemset which completed
+        a full scan over the dataset is closed off as solid.
 
-                for path in paths:
-                    node = Node.root.find_node(path)
-                    if node.state != State.SOLID_BOX and node.state != State.DASHED_BOX:
-                        transition_child = False
-                        break
+        """
+        for node in Node.to_transition:
+            node.handle_supersets()
+        for node in Node.to_finalize:
+            node.state = State.SOLID_CIRCLE if node.state == State.DASHED_CIRCLE else State.SOLID_BOX
 
-            if transition_child:
-                self.children[child].state = State.DASHED_CIRCLE
+        Node.to_transition = []
+        Node.to_finalize = []
 
     def increment(self, tid, S=()):
         """
@@ -221,16 +249,11 @@ class Node:
             # If an entire scan over the dataset has completed we must stop counting.
             # For scenarios where the same item can appear in a single transaction, we avoid errant
             # state transitions to Solid by ensuring the tid is the same while scan ids are different.
+            # The node is closed off once the block has been counted, so it is only queued the first time.
             if tid in self.indices:
-
-                def finalize_state(node):
-                    def execute():
-                        node.state = State.SOLID_CIRCLE if self.state == State.DASHED_CIRCLE else State.SOLID_BOX
-                        node.is_finalized = False
-                    return execute
                 if not self.is_finalized:
                     self.is_finalized = True
-                    Node.to_finalize.add(finalize_state(self))
+                    Node.to_finalize.append(self)
 
             # If the full scan for this itemset is not compelte, count this transaction.
             else:
@@ -241,19 +264,11 @@ class Node:
                 self.indices.append(tid)
                 self.support = Node.calculate_support(self.support)
 
-            # If the itemset is a candidate to be suspected of being large, transition and check its supersets
-            # for the possibility of being small.
+            # If the itemset is a candidate to be suspected of being large, transition it. Its supersets are
+            # only checked once the block has been counted.
             if self.support > Node.min_sup and self.state == State.DASHED_CIRCLE:
-                def transition_state(node):
-                    def execute():
-                        if node.state == State.DASHED_CIRCLE:
-                            node.state = State.DASHED_BOX
-                            node.handle_supersets()
-                        node.has_transitioned = False
-                    return execute
-                if not self.has_transitioned:
-                    self.has_transitioned = True
-                    Node.to_transition.add(transition_state(self))
+                self.state = State.DASHED_BOX
+                Node.to_transition.append(self)
 
         # For every item in the observation, traverse the Node's children and increment and add as needed.
         # If an item has been encountered before, do not double count it. Skip to the next iteration.
@@ -269,6 +284,38 @@ class Node:
                     self.add_child(Si)
                     self.children[Si].increment(tid, S[i+1:])
 
+    def count_pending(self, S=()):
+        """
+        Count a single observation against every pending node below this one whose itemset is a subset of S.
+        Unlike increment, no nodes are added and no states are transitioned.
+
+        Parameters
+        ----------
+        S : Sorted tuple of values being observed.
+             (Default value = ())
+
+        """
+        for i, Si in enumerate(S):
+            child = self.children.get((Si,), None)
+            if child is None:
+                continue
+            if child.pending:
+                child.support = Node.calculate_support(child.support)
+            child.count_pending(S[i+1:])
+
+    def large_itemsets(self):
+        """
+        Traverse the tree and collect every itemset suspected or confirmed of being large.
+
+        Returns
+        -------
+        A generator of the itemsets of all boxed nodes below this one.
+        """
+        for child in self.children.values():
+            if child.state == State.SOLID_BOX or child.state == State.DASHED_BOX:
+                yield child.items
+            yield from child.large_itemsets()
+
     def get_depth(self):
         """
         Returns
@@ -0,0 +1,219 @@
+import heapq
+import time
+
+import pandas as pd
+
+from Node import Node
+
+
+class RuleIndex:
+    """
+    Inverted index over mined association rules for serving them against baskets of items.
+
+    Rule ids are assigned in order of descending confidence, so sorting matched rule ids sorts them by confidence.
+    Each rule is posted once, under the least common item of its antecedent, and antecedents are kept as bitsets
+    so that a posted rule is confirmed against a basket with a single mask.
+
+    Parameters
+    ----------
+
+    rules : Dictionary of rules keyed by (antecedent, consequent) tuples with 'support' and 'confidence' values,
+    as produced by Node.generate_rules.
+
+    """
+
+    def __init__(self, rules):
+        self.rules = sorted(rules.items(), key=lambda rule: rule[1]['confidence'], reverse=True)
+        self.bits = dict()
+        self.antecedents = []
+        self.index = dict()
+
+        # Count how many antecedents each item appears in so each rule can be posted under its rarest item.
+        frequency = dict()
+        for (antecedent, _), _ in self.rules:
+            for item in antecedent:
+                frequency[item] = frequency.get(item, 0) + 1
+                if item not in self.bits:
+                    self.bits[item] = 1 << len(self.bits)
+
+        for rule_id, ((antecedent, _), _) in enumerate(self.rules):
+            self.antecedents.append(self.to_bitset(antecedent))
+            self.index.setdefault(min(antecedent, key=frequency.get), []).append(rule_id)
+
+    def __len__(self):
+        return len(self.rules)
+
+    def to_bitset(self, items):
+        """
+        Encode items as a bitset. Items which appear in no antecedent are ignored.
+
+        Parameters
+        ----------
+        items : Iterable of items to encode.
+
+        Returns
+        -------
+        An integer with the bit of every known item in items set.
+        """
+        bitset = 0
+        for item in items:
+            bitset |= self.bits.get(item, 0)
+        return bitset
+
+    def query(self, basket, n=None):
+        """
+        Find all rules whose antecedent is a subset of basket, sorted by confidence.
+
+        Parameters
+        ----------
+        basket : Iterable of items being observed.
+
+        n : Maximum number of rules to return. All matches are returned if None.
+             (Default value = None)
+
+        Returns
+        -------
+        A list of ((antecedent, consequent), {'support', 'confidence'}) pairs in order of descending confidence.
+        """
+        basket = set(basket)
+        bitset = self.to_bitset(basket)
+        antecedents = self.antecedents
+
+        matches = []
+        for item in basket:
+            for rule_id in self.index.get(item, ()):
+                if antecedents[rule_id] & bitset == antecedents[rule_id]:
+                    matches.append(rule_id)
+
+        matches = sorted(matches) if n is None else heapq.nsmallest(n, matches)
+        return [self.rules[rule_id] for rule_id in matches]
+
+    def query_batch(self, baskets, n=None):
+        """
+        Find the rules which apply to each of many baskets at once. Baskets are grouped by the items they hold,
+        so each posting list is read a single time and its rules checked against every basket holding that item.
+        Identical baskets are only matched once, but each is given its own result list.
+
+        Parameters
+        ----------
+        baskets : Iterable of baskets, each an iterable of items.
+
+        n : Maximum number of rules to return per basket. All matches are returned if None.
+             (Default value = None)
+
+        Returns
+        -------
+        A list holding the result of query for each basket, in the order the baskets were given.
+        """
+        baskets = [frozenset(basket) for basket in baskets]
+        unique = list(dict.fromkeys(baskets))
+        bitsets = [self.to_bitset(basket) for basket in unique]
+        antecedents = self.antecedents
+
+        # Group the unique baskets by each posted item they hold.
+        holders = dict()
+        for basket_id, basket in enumerate(unique):
+            for item in basket:
+                if item in self.index:
+                    holders.setdefault(item, []).append(basket_id)
+
+        matches = [[] for _ in unique]
+        for item, basket_ids in holders.items():
+            for rule_id in self.index[item]:
+                antecedent = antecedents[rule_id]
+                for basket_id in basket_ids:
+                    if antecedent & bitsets[basket_id] == antecedent:
+                        matches[basket_id].append(rule_id)
+
+        results = dict()
+        for basket, rule_ids in zip(unique, matches):
+            rule_ids = sorted(rule_ids) if n is None else heapq.nsmallest(n, rule_ids)
+            results[basket] = [self.rules[rule_id] for rule_id in rule_ids]
+        return [list(results[basket]) for basket in baskets]
+
+
+def scan_rules(basket, n=None):
+    # Baseline lookup: check every rule in Node.rules against the basket.
+    basket = set(basket)
+    matches = [(key, rule) for key, rule in Node.rules.items() if basket.issuperset(key[0])]
+    matches.sort(key=lambda match: match[1]['confidence'], reverse=True)
+    return matches if n is None else matches[:n]
+
+
+def benchmark(data, n=10, log_time=None):
+    """
+    Time serving rules for every row of data, first by scanning Node.rules and then through a RuleIndex.
+
+    Parameters
+    ----------
+    data : DataFrame of baskets to serve rules for.
+
+    n : Number of rules to return per basket.
+         (Default value = 10)
+
+    log_time : Dictionary of lists to also record the returned timings in.
+         (Default value = None)
+
+    Returns
+    -------
+    A dictionary of the number of rules, the index build time in milliseconds and the per basket latency of each
+    method in microseconds. Latencies are 0 if data holds no baskets.
+    """
+    baskets = [[item for item in row if item != '-1' and item is not None] for row in data.values]
+
+    ts = time.time()
+    [scan_rules(basket, n) for basket in baskets]
+    te = time.time()
+    scan_time = (te - ts) * 1000
+
+    ts = time.time()
+    index = RuleIndex(Node.rules)
+    te = time.time()
+    build_time = (te - ts) * 1000
+
+    ts = time.time()
+    [index.query(basket, n) for basket in baskets]
+    te = time.time()
+    query_time = (te - ts) * 1000
+
+    ts = time.time()
+    index.query_batch(baskets, n)
+    te = time.time()
+    batch_time = (te - ts) * 1000
+
+    # Per basket latencies are recorded in microseconds.
+    def latency(total):
+        return int(total * 1000 / len(baskets)) if baskets else 0
+
+    timings = {
+        'rules': len(index),
+        'build': int(build_time),
+        'scan': latency(scan_time),
+        'query': latency(query_time),
+        'batch': latency(batch_time)
+    }
+
+    if log_time is not None:
+        for key, value in timings.items():
+            log_time[key].append(value)
+
+    return timings
+
+
+if __name__ == '__main__':
+    from main import DIC
+
+    data = pd.read_csv("league_cleaned3.csv")
+
+    time_data = {"min_sup": [], "rules": [], "build": [], "scan": [], "query": [], "batch": []}
+    mining_time = {"time": [], "m": [], "min_sup": [], "min_conf": [], "passes": []}
+
+    for min_sup in [0.005, 0.01, .02, 0.03, 0.04, 0.05]:
+        DIC(data, grid={"m": [100], "min_sup": [min_sup], "min_conf": [0.0]}, log_time=mining_time)
+        benchmark(data, log_time=time_data)
+        time_data["min_sup"].append(min_sup)
+
+    results = pd.DataFrame.from_dict(time_data)
+    results.to_csv("RuleIndex_League3_Results.csv", index=False)
+    results = pd.DataFrame.from_dict(mining_time)
+    results.to_csv("RuleIndex_League3_Mining_Results.csv", index=False)
@@ -2,8 +2,11 @@ import csv
 import os
 
 import gc
+import math
+import warnings
 
 from Node import Node
+from StateEnum import State
 import pandas as pd
 import time
 
@@ -24,6 +27,7 @@ def timeit(method):
                         Node.min_sup = min_sup
                         Node.rules = dict()
                         Node.rule_count = 0
+                        Node.pass_count = 0
 
                         ts = time.time()
                         result = method(*args, root=root, m=m, **kw)
@@ -33,6 +37,7 @@ def timeit(method):
                         kw['log_time']['m'].append(m)
                         kw['log_time']["min_sup"].append(min_sup)
                         kw['log_time']["min_conf"].append(min_conf)
+                        kw['log_time']["passes"].append(Node.pass_count)
 
                         del root
                         gc.collect()
@@ -42,11 +47,24 @@ def timeit(method):
     return timed
 
 
-@timeit
-def DIC(data, root, m, **kwargs):
+def scan(data, root, m):
+    """
+    Mine data with DIC, passing over it in m-sized blocks until no dashed itemsets remain.
+
+    Parameters
+    ----------
+    data : DataFrame of transactions to mine.
+
+    root : Root node of the trie to count itemsets into.
+
+    m : Number of transactions per block.
+
+    Returns
+    -------
+    The number of full passes made over data.
+    """
     # Initial pass to build Itemsets of size 1
-    x = [val for d in data for val in data[d].unique()]
-    for i, d in enumerate([val for d in data for val in data[d].unique()]):
+    for d in [val for d in data for val in data[d].unique()]:
         if d == '-1':
             continue
         root.add_child((d,), tid=0)
@@ -58,15 +76,137 @@ def DIC(data, root, m, **kwargs):
             for j, d in enumerate(data[i * m:end].iterrows()):
                 row = list(filter(lambda e: e != '-1' and e is not None, d[1]))
                 root.increment(m * i + j, sorted(row))
-            for executable in Node.to_transition:
-                executable()
-            for executable in Node.to_finalize:
-                executable()
-            Node.to_transition = set()
-            Node.to_finalize = set()
+            Node.apply_transitions()
         scan_num += 1
+
+    return scan_num
+
+
+def negative_border(frequent, items):
+    """
+    Find the negative border of a downward closed collection of itemsets: the itemsets which are not frequent
+    themselves but all of whose immediate subsets are.
+
+    Parameters
+    ----------
+    frequent : Set of frozensets, all considered frequent.
+
+    items : Set of every item in the dataset.
+
+    Returns
+    -------
+    Set of frozensets making up the negative border of frequent.
+    """
+    border = {frozenset((item,)) for item in items}.difference(frequent)
+    for itemset in frequent:
+        for item in items.difference(itemset):
+            candidate = itemset.union((item,))
+            if candidate not in frequent and all(candidate.difference((i,)) in frequent for i in candidate):
+                border.add(candidate)
+    return border
+
+
+def toivonen(data, root, m, sample=0.1, sample_sup=None, sample_error=0.05, seed=None):
+    """
+    Sampling based mining as per Toivonen. A random sample is mined in memory with DIC at a lowered support
+    threshold. The itemsets found, along with their negative border, are then verified with a single pass over data.
+    Another pass is only made if an itemset of the negative border turns out to be large, in which case the border
+    of the enlarged collection is counted until it holds no large itemsets.
+
+    Parameters
+    ----------
+    data : DataFrame of transactions to mine.
+
+    root : Root node of the trie to count verified itemsets into.
+
+    m : Number of transactions per block when mining the sample.
+
+    sample : Fraction of data to sample if a float no larger than 1, else the number of transactions to sample.
+    Never more than the whole of data is sampled.
+         (Default value = 0.1)
+
+    sample_sup : Lowered support threshold used on the sample. If None, it is lowered from min_sup by Toivonen's
+    bound for sample_error. If the sample is too small for that bound to be at most half of min_sup, a warning is
+    raised and half of min_sup is used instead, which is a heuristic that carries no guarantee for sample_error.
+         (Default value = None)
+
+    sample_error : Probability of the bound on the sample support deviating from the true support.
+         (Default value = 0.05)
+
+    seed : Random state used to draw the sample.
+         (Default value = None)
+
+    Returns
+    -------
+    The number of full passes made over data. Passes made while mining the sample are included when the sample
+    holds the whole of data.
+    """
+    min_sup = Node.min_sup
+    total_records = Node.total_records
+
+    size = int(len(data) * sample) if isinstance(sample, float) and sample <= 1 else int(sample)
+    size = min(max(size, 1), len(data))
+    if sample_sup is None:
+        bound = math.sqrt(math.log(1 / sample_error) / (2 * size))
+        if bound > min_sup / 2:
+            warnings.warn("A sample of {} transactions is too small to bound the error at {} for min_sup {}. "
+                          "Falling back to a sample threshold of min_sup / 2 without that guarantee."
+                          .format(size, sample_error, min_sup))
+        sample_sup = min_sup - min(bound, min_sup / 2)
+
+    # Mine the sample with the lowered threshold in a trie of its own.
+    sample_root = Node()
+    Node.root, Node.total_records, Node.min_sup = sample_root, size, sample_sup
+    try:
+        sample_passes = scan(data.sample(n=size, random_state=seed), sample_root, m)
+    finally:
+        Node.root, Node.total_records, Node.min_sup = root, total_records, min_sup
+        Node.to_transition = []
+        Node.to_finalize = []
+
+    items = {val for d in data for val in data[d].unique() if val != '-1' and val is not None}
+    large = set()
+    counted = {frozenset(itemset) for itemset in sample_root.large_itemsets()}
+    candidates = counted.union(negative_border(counted, items))
+
+    # A sample of the whole dataset is itself mined with full passes over it.
+    scan_num = sample_passes if size == len(data) else 0
+    while candidates:
+        nodes = [root.add_itemset(sorted(itemset)) for itemset in candidates]
+        for node in nodes:
+            node.pending = True
+
+        for d in data.iterrows():
+            row = list(filter(lambda e: e != '-1' and e is not None, d[1]))
+            root.count_pending(sorted(set(row)))
+        scan_num += 1
+
+        for node in nodes:
+            node.pending = False
+            node.state = State.SOLID_BOX if node.support > Node.min_sup else State.SOLID_CIRCLE
+            if node.state == State.SOLID_BOX:
+                large.add(frozenset(node.items))
+
+        # The border check fails only if a border itemset was large, leaving part of the new border uncounted.
+        counted.update(candidates)
+        candidates = negative_border(large, items).difference(counted)
+
+    return scan_num
+
+
+@timeit
+def DIC(data, root, m, **kwargs):
+    """
+    Mine data with DIC. If a sample is given, sampling based mining as per Toivonen is used instead.
+    """
+    if kwargs.get('sample', False):
+        Node.pass_count = toivonen(data, root, m, sample=kwargs['sample'], sample_sup=kwargs.get('sample_sup'),
+                                   sample_error=kwargs.get('sample_error', 0.05), seed=kwargs.get('seed'))
+    else:
+        Node.pass_count = scan(data, root, m)
+
     root.generate_rules()
-    print(len(Node.rules), "Rules found.")
+    print(len(Node.rules), "Rules found in", Node.pass_count, "full passes.")
 
     return root
 
@@ -82,7 +222,7 @@ def main():
 
     data = pd.read_csv("league_cleaned3.csv")
 
-    time_data = {"time": [], "m": [], "min_sup": [], "min_conf": []}
+    time_data = {"time": [], "m": [], "min_sup": [], "min_conf": [], "passes": []}
 
     grid = {
         "m": [100, 500, 1000],